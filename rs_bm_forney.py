@@ -1,48 +1,17 @@
 #!/usr/bin/env python3
 # rs_bm_forney.py
 # RS decoder based on Berlekamp–Massey + Forney (GF(2^8), prim 0x11d)
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
+from functools import lru_cache, reduce
+from operator import add, getitem, xor
 import json
 from pprint import pprint
+from rs_codec import _jit
+# one GF implementation for the whole project; get_gf shares instances per field
+from rs_codec.gf import GF, PRIM, GENERATOR, get_gf
 
-PRIM = 0x11d
-
-class GF:
-    def __init__(self, prim=PRIM):
-        self.prim = prim
-        self.n = 255
-        self.exp = [0] * (2 * self.n + 1)
-        self.log = [-1] * (self.n + 1)
-        x = 1
-        for i in range(self.n):
-            self.exp[i] = x
-            self.log[x] = i
-            x <<= 1
-            if x & 0x100:
-                x ^= self.prim
-        for i in range(self.n, 2 * self.n + 1):
-            self.exp[i] = self.exp[i - self.n]
-
-    def add(self, a: int, b: int) -> int:
-        return a ^ b
-
-    def mul(self, a: int, b: int) -> int:
-        if a == 0 or b == 0:
-            return 0
-        return self.exp[(self.log[a] + self.log[b]) % self.n]
-
-    def div(self, a: int, b: int) -> int:
-        assert b != 0
-        if a == 0:
-            return 0
-        return self.exp[(self.log[a] - self.log[b]) % self.n]
-
-    def inv(self, a: int) -> int:
-        assert a != 0
-        return self.exp[(self.n - self.log[a]) % self.n]
-
-    def alpha_pow(self, p: int) -> int:
-        return self.exp[p % self.n]
+# codewords may be passed as int lists or as bytes-like objects
+Codeword = Union[List[int], bytes, bytearray]
 
 def poly_trim(p: List[int]) -> List[int]:
     i = 0
@@ -54,49 +23,101 @@ def poly_trim(p: List[int]) -> List[int]:
 # But BM commonly uses coefficients in ascending order (constant term first).
 # We'll convert syndrome list into ascending order for BM.
 
-def compute_syndromes(received: List[int], nsym: int, gf: GF) -> List[int]:
+@lru_cache(maxsize=32)
+def _syndrome_log_table(n: int, nsym: int) -> Tuple[Tuple[int, ...], ...]:
+    # row j-1 holds log(alpha^{(n-1-i)*j}) for each received index i; logs of
+    # powers of alpha don't depend on the field polynomial, so (n, nsym) is the key
+    return tuple(tuple(((n - 1 - i) * j) % 255 for i in range(n)) for j in range(1, nsym+1))
+
+# Up to this many syndromes fit in one 64-bit word, one byte lane per S_j
+PACKED_MAX_NSYM = 8
+# The packed path keeps one 256-entry row of ints per codeword position, so it is
+# limited to short codewords: a row set holds at most PACKED_MAX_N rows (~0.7 MB),
+# and a row costs ~256 XORs to build. Longer codewords use the log-table path below.
+PACKED_MAX_N = 64
+
+@lru_cache(maxsize=4)
+def _packed_rows(nsym: int, prim: int, generator: int) -> List[Tuple[int, ...]]:
+    # rows[p] for powers p = 0..len(rows)-1, extended on demand by compute_syndromes.
+    # Keyed by field parameters rather than GF instance so fresh GF objects share it.
+    return []
+
+def _packed_syndrome_row(p: int, nsym: int, gf: GF) -> Tuple[int, ...]:
+    # row[v] packs v * alpha^{p*j} for j=1..nsym into byte lane j-1: everything a
+    # symbol v at power p contributes to the syndromes, in one int
+    exp, log = gf.exp, gf.log
+    steps = [(p * j) % gf.n for j in range(1, nsym+1)]
+    row = [0] * 256
+    # multiplying by a constant is GF(2)-linear in v: fill the single-bit entries,
+    # then row[v] = row[v without its low bit] ^ row[low bit]
+    for bit in range(8):
+        lv = log[1 << bit]
+        packed = 0
+        for lane, step in enumerate(steps):
+            packed |= exp[lv + step] << (8 * lane)
+        row[1 << bit] = packed
+    for v in range(3, 256):
+        low = v & -v
+        if v != low:
+            row[v] = row[v ^ low] ^ row[low]
+    return tuple(row)
+
+def compute_syndromes(received: Codeword, nsym: int, gf: GF) -> List[int]:
     # Compute S1..S_nsym, S_j = r(alpha^j) for j=1..nsym
     n = len(received)
-    S = []
-    for j in range(1, nsym+1):
-        s = 0
-        for i, val in enumerate(received):
-            if val == 0:
-                continue
-            # For systematic codeword: ordering is msg (highest coefficients) + parity
-            # We evaluate r at alpha^j using index mapping: position i -> power (n-1 - i)
-            power = (n - 1 - i) % gf.n
-            a = gf.alpha_pow((power * j) % gf.n)
-            s ^= gf.mul(val, a)
-        S.append(s)
-    return S
+    if nsym <= PACKED_MAX_NSYM and n <= PACKED_MAX_N:
+        # SWAR: one table load + one XOR per received byte yields all syndromes;
+        # received index i carries power (n-1 - i)
+        rows = _packed_rows(nsym, gf.prim, gf.generator)
+        if len(rows) < n:
+            rows.extend(_packed_syndrome_row(p, nsym, gf) for p in range(len(rows), n))
+        packed = reduce(xor, map(getitem, rows[n-1::-1], received), 0)
+        return [(packed >> (8 * j)) & 0xFF for j in range(nsym)]
+    # position i carries power (n-1 - i), so S_j = XOR_i r_i * alpha^{(n-1-i)*j}.
+    # With the cached table each S_j is one streaming pass: add logs, look up, XOR-fold.
+    # log[0] is the Zech sentinel, so zero symbols drop out without a branch.
+    exp, log = gf.exp, gf.log
+    getexp = exp.__getitem__
+    log_r = [log[v] for v in received]
+    return [reduce(xor, map(getexp, map(add, log_r, row)), 0)
+            for row in _syndrome_log_table(len(received), nsym)]
 
 def berlekamp_massey(synd: List[int], gf: GF) -> List[int]:
     # synd list S1..S2t (highest to lowest j), produce locator polynomial coefficients (constant-first)
-    # Implementation follows standard BM producing sigma(x) with sigma[0]=1
+    # Implementation follows standard BM producing sigma(x) with sigma[0]=1; returns [1] for all-zero syndromes
+    if _jit.HAVE_NUMBA:
+        return _jit.berlekamp_massey(synd, gf)
     n = len(synd)
+    # While L == 0 every zero syndrome is a zero discrepancy, so skip the leading
+    # zero rounds in one step. All-zero syndromes (no errors) give sigma = [1].
+    start = next((i for i, s in enumerate(synd) if s), n)
+    if start == n:
+        return [1]
+    exp, log = gf.exp, gf.log
     C = [1] + [0]*n
     B = [1] + [0]*n
     L = 0
-    m = 1
+    m = 1 + start
     b = 1
-    for i in range(n):
-        # compute discrepancy
+    C_nz = []  # indices j >= 1 with C[j] != 0, ascending
+    for i in range(start, n):
+        # compute discrepancy over the nonzero terms of C only
         d = synd[i]
-        for j in range(1, L+1):
-            if C[j] != 0 and synd[i-j] != 0:
-                d ^= gf.mul(C[j], synd[i-j])
+        for j in C_nz:
+            if j > L:
+                break
+            d ^= exp[log[C[j]] + log[synd[i-j]]]
         if d == 0:
             m += 1
         else:
             T = C[:]
-            coef = gf.div(d, b)
+            lc = log[gf.div(d, b)]
             # C = C - coef * x^m * B
             for j in range(0, n - (m) + 1):
                 if B[j] != 0:
-                    C[j + m] ^= gf.mul(coef, B[j])
+                    C[j + m] ^= exp[lc + log[B[j]]]
+            C_nz = [j for j in range(1, n+1) if C[j] != 0]
             if 2*L <= i:
-                L2 = i + 1 - L
                 B = T
                 b = d
                 L = i + 1 - L
@@ -108,26 +129,33 @@ def berlekamp_massey(synd: List[int], gf: GF) -> List[int]:
 
 def chien_search(locator: List[int], gf: GF, n: int) -> List[int]:
     # locator is constant-first (sigma[0]=1)
+    if _jit.HAVE_NUMBA:
+        return _jit.chien_search(locator, gf, n)
+    # Incremental Chien: term j of sigma(alpha^{-i}) is sigma_j * alpha^{-ij}, so keep
+    # each nonzero term and multiply it by gamma_j = alpha^{-j} once per step
+    exp, log = gf.exp, gf.log
+    t = [coef for coef in locator if coef != 0]
+    log_gammas = [(-j) % gf.n for j, coef in enumerate(locator) if coef != 0]
     roots = []
     for i in range(n):
-        # evaluate sigma(alpha^{-i})
-        x = gf.alpha_pow((-i) % gf.n)
-        val = 0
-        powx = 1
-        for coef in locator:
-            if coef != 0:
-                val ^= gf.mul(coef, powx)
-            powx = gf.mul(powx, x)
-        if val == 0:
+        # t holds the terms of sigma(alpha^{-i})
+        if reduce(xor, t, 0) == 0:
             roots.append(i)
+        t = [exp[log[v] + g] for v, g in zip(t, log_gammas)]
     return roots
 
 def poly_mul(a: List[int], b: List[int], gf: GF) -> List[int]:
     # a,b constant-first
+    # outer sum of logs: a[i]*b[j] == exp[log[a[i]] + log[b[j]]], zero terms skipped
+    exp, log = gf.exp, gf.log
     res = [0]*(len(a)+len(b)-1)
+    b_terms = [(j, log[bj]) for j, bj in enumerate(b) if bj != 0]
     for i, ai in enumerate(a):
-        for j, bj in enumerate(b):
-            res[i+j] ^= gf.mul(ai, bj)
+        if ai == 0:
+            continue
+        la = log[ai]
+        for j, lb in b_terms:
+            res[i+j] ^= exp[la + lb]
     return res
 
 def poly_scale(a: List[int], scalar: int, gf: GF) -> List[int]:
@@ -160,49 +188,51 @@ def poly_divmod_constant_first(a: List[int], b: List[int], gf: GF) -> Tuple[List
 def forney_evaluator(synd: List[int], locator: List[int], gf: GF, nsym: int) -> List[int]:
     # compute Omega(x) = (S(x) * Lambda(x)) mod x^{nsym}
     # represent S(x) as polynomial with coefficients S1..Snsym in ascending order for powers x^0.. (S1 is coeff of x^0)
-    S_poly = synd[:]  # S1..Snsym => S[0] is coeff for x^0
-    Omega = poly_mul(S_poly, locator, gf)
-    # take first nsym coefficients
-    return Omega[:nsym]
+    # S1..Snsym => S[0] is coeff for x^0
+    # truncated product: terms of degree >= nsym are never computed
+    exp, log = gf.exp, gf.log
+    Omega = [0] * min(nsym, len(synd) + len(locator) - 1)
+    loc_terms = [(j, log[c]) for j, c in enumerate(locator) if c != 0]  # ascending j
+    for i, si in enumerate(synd[:len(Omega)]):
+        if si == 0:
+            continue
+        ls = log[si]
+        for j, lc in loc_terms:
+            if i + j >= len(Omega):
+                break
+            Omega[i+j] ^= exp[ls + lc]
+    return Omega
 
 def forney(omega: List[int], locator: List[int], err_pos: List[int], gf: GF) -> List[int]:
     # compute error magnitudes using Forney formula:
     # E_i = - Omega(alpha^{-pos}) / Lambda'(alpha^{-pos})
     # locator and omega are constant-first
-    err_mags = []
-    # derivative of locator
-    deriv = []
-    for i in range(1, len(locator)):
-        if i % 2 == 1:
-            deriv.append(locator[i])
-        else:
-            deriv.append(0)
-    # deriv is constant-first but one degree shorter
-    for pos in err_pos:
-        x = gf.alpha_pow((-pos) % gf.n)
-        # evaluate Omega at x
-        num = 0
-        powx = 1
-        for coef in omega:
-            if coef != 0:
-                num ^= gf.mul(coef, powx)
-            powx = gf.mul(powx, x)
-        # evaluate deriv at x
-        den = 0
-        powx = 1
-        for coef in deriv:
-            if coef != 0:
-                den ^= gf.mul(coef, powx)
-            powx = gf.mul(powx, x)
-        if den == 0:
-            return None
-        val = gf.div(num, den)
-        # error value is -val, but subtraction == addition in GF(2^m)
-        err_mags.append(val)
-    return err_mags
+    # All roots are evaluated together: X[r] holds x_r^k while k walks the coefficients.
+    # Lambda'(x) = sum of lambda_k * x^{k-1} over odd k, so the derivative term
+    # lambda_{k+1} * x^k is added on even k and no deriv list is built.
+    exp, log = gf.exp, gf.log
+    log_x = [gf.n - pos for pos in err_pos]  # log(alpha^{-pos}) == n - pos
+    X = [1] * len(err_pos)
+    num = [0] * len(err_pos)
+    den = [0] * len(err_pos)
+    for k in range(max(len(omega), len(locator) - 1)):
+        if k < len(omega) and omega[k] != 0:
+            lc = log[omega[k]]
+            num = [v ^ exp[lc + log[x]] for v, x in zip(num, X)]
+        if k % 2 == 0 and k + 1 < len(locator) and locator[k+1] != 0:
+            lc = log[locator[k+1]]
+            den = [v ^ exp[lc + log[x]] for v, x in zip(den, X)]
+        X = [exp[log[x] + lx] for x, lx in zip(X, log_x)]
+    if 0 in den:
+        return None
+    # error value is -val, but subtraction == addition in GF(2^m)
+    return [gf.div(a, b) for a, b in zip(num, den)]
 
-def rs_bm_forney_decode(received: List[int], nsym: int, prim: int = PRIM, verbose: bool = False) -> Tuple[List[int], dict]:
-    gf = GF(prim)
+def rs_bm_forney_decode(received: Codeword, nsym: int, prim: int = PRIM, verbose: bool = False,
+                        generator: int = GENERATOR) -> Tuple[Codeword, dict]:
+    # the corrected word is returned as the same type as received (list, bytes or bytearray)
+    # prim/generator must match the encoder's field, e.g. GFNI_PRIM/GFNI_GENERATOR
+    gf = get_gf(prim, generator)
     n = len(received)
     info = {'syndromes': None, 'locator': None, 'error_positions': [], 'error_magnitudes': [], 'corrected': False}
     if verbose:
@@ -213,14 +243,15 @@ def rs_bm_forney_decode(received: List[int], nsym: int, prim: int = PRIM, verbos
     info['syndromes'] = S
     if verbose:
         print(f"Syndromes computed: {S}")
-    if all(x == 0 for x in S):
+    if verbose:
+        print("Running Berlekamp-Massey algorithm to find error locator polynomial...")
+    sigma = berlekamp_massey(S, gf)  # sigma constant-first
+    if len(sigma) == 1:
+        # BM returns sigma == [1] exactly when all syndromes are zero
         if verbose:
             print("All syndromes zero, no errors detected.")
         info['corrected'] = True
         return received[:], info
-    if verbose:
-        print("Running Berlekamp-Massey algorithm to find error locator polynomial...")
-    sigma = berlekamp_massey(S, gf)  # sigma constant-first
     info['locator'] = sigma
     if verbose:
         print(f"Error locator polynomial coefficients (constant-first): {sigma}")
@@ -247,7 +278,8 @@ def rs_bm_forney_decode(received: List[int], nsym: int, prim: int = PRIM, verbos
         return received[:], info
     if verbose:
         print(f"Error magnitudes computed: {errs}")
-    corrected = received[:]
+    # correct in place on a bytearray: no boxed ints per XOR
+    corrected = bytearray(received)
     # in our syndrome eval we used position -> power = (n-1 - i)
     # chien_search returned pos such that alpha^{-pos} is root; this pos corresponds to power index
     # mapping from pos to index i: power = pos => index = n-1 - pos
@@ -270,7 +302,7 @@ def rs_bm_forney_decode(received: List[int], nsym: int, prim: int = PRIM, verbos
         info['corrected'] = True
         info['error_positions'] = mapped_positions
         info['error_magnitudes'] = errs
-        return corrected, info
+        return type(received)(corrected), info
     if verbose:
         print("Syndromes not zero after correction, decoding failed.")
     return received[:], info
@@ -0,0 +1,84 @@
+# rs_codec/_jit.py
+# Optional Numba kernels for the decoder's Berlekamp-Massey and Chien search loops.
+# numba is not a requirement: HAVE_NUMBA is False when it (or numpy) is missing and
+# callers keep using their pure-Python loops.
+from functools import lru_cache
+from typing import List
+
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def _gf_mul(a, b, exp_tab, log_tab):
+        # exp table is doubled, so the log sum needs no modulo
+        if a == 0 or b == 0:
+            return 0
+        return exp_tab[log_tab[a] + log_tab[b]]
+
+    @njit(cache=True)
+    def _bm(synd, exp_tab, log_tab, field_n):
+        n = synd.shape[0]
+        C = np.zeros(n + 1, np.int16)
+        B = np.zeros(n + 1, np.int16)
+        C[0] = 1
+        B[0] = 1
+        L = 0
+        m = 1
+        b = 1
+        for i in range(n):
+            d = np.int16(synd[i])
+            for j in range(1, L + 1):
+                d ^= _gf_mul(C[j], synd[i - j], exp_tab, log_tab)
+            if d == 0:
+                m += 1
+            else:
+                T = C.copy()
+                coef = exp_tab[(log_tab[d] - log_tab[b]) % field_n]
+                for j in range(0, n - m + 1):
+                    C[j + m] ^= _gf_mul(coef, B[j], exp_tab, log_tab)
+                if 2 * L <= i:
+                    B = T
+                    b = d
+                    L = i + 1 - L
+                    m = 1
+                else:
+                    m += 1
+        return C[:L + 1]
+
+    @njit(cache=True)
+    def _chien(loc, exp_tab, log_tab, n, field_n):
+        roots = np.empty(n, np.int64)
+        count = 0
+        for i in range(n):
+            x = exp_tab[(field_n - i % field_n) % field_n]
+            val = 0
+            powx = 1
+            for k in range(loc.shape[0]):
+                val ^= _gf_mul(loc[k], powx, exp_tab, log_tab)
+                powx = _gf_mul(powx, x, exp_tab, log_tab)
+            if val == 0:
+                roots[count] = i
+                count += 1
+        return roots[:count]
+
+    @lru_cache(maxsize=8)
+    def _tables(gf):
+        return (np.fromiter(gf.exp, dtype=np.uint8),
+                np.fromiter(gf.log, dtype=np.int16))
+
+def berlekamp_massey(synd: List[int], gf) -> List[int]:
+    """JIT Berlekamp-Massey; same contract as the pure-Python decoder version."""
+    exp_tab, log_tab = _tables(gf)
+    C = _bm(np.array(synd, dtype=np.int16), exp_tab, log_tab, gf.n)
+    return [int(c) for c in C]
+
+def chien_search(locator: List[int], gf, n: int) -> List[int]:
+    """JIT Chien search; same contract as the pure-Python decoder version."""
+    exp_tab, log_tab = _tables(gf)
+    roots = _chien(np.array(locator, dtype=np.int16), exp_tab, log_tab, n, gf.n)
+    return [int(r) for r in roots]
@@ -1,9 +1,12 @@
 # rs_codec/encoder.py
 # High-level RS encoder (systematic). External-facing API.
-from typing import List
-from .gf import GF
-from .generator import rs_generator_poly 
-from .poly import divmod_poly, trim
+from typing import List, Union
+from .gf import PRIM, GENERATOR, get_gf
+from .generator import _cached_gen
+from .poly import rs_remainder
+
+# messages/codewords may be int lists or bytes-like objects
+Symbols = Union[List[int], bytes, bytearray]
 
 class RSCodec:
     """
@@ -12,50 +15,44 @@ class RSCodec:
     Usage:
         codec = RSCodec(nsym=4)
         cw = codec.encode(msg)           # returns msg + parity (shortened)
+        cws = codec.encode_batch(msgs)   # many equal-length messages at once
         parity = codec.parity_for(msg)   # returns parity bytes only
+
+    prim/generator select the field; e.g. RSCodec(4, prim=GFNI_PRIM, generator=GFNI_GENERATOR)
+    uses the GFNI/AES polynomial. Codewords differ from the default 0x11d field.
     """
 
-    def __init__(self, nsym: int, prim: int = None):
+    def __init__(self, nsym: int, prim: int = None, generator: int = None):
         self.nsym = int(nsym)
-        self.gf = GF(prim) if prim is not None else GF()
+        self.gf = get_gf(PRIM if prim is None else prim,
+                         GENERATOR if generator is None else generator)
         self.n = self.gf.n  # 255
-        self._gen = None
 
     def generator(self) -> List[int]:
-        if self._gen is None:
-            self._gen = rs_generator_poly(self.nsym, self.gf)
-        return self._gen
+        # memoized per (nsym, field), so new codecs don't rebuild it
+        return list(_cached_gen(self.nsym, self.gf.prim, self.gf.generator))
 
-    def parity_for(self, msg: List[int]) -> List[int]:
+    def parity_for(self, msg: Symbols) -> List[int]:
         """
         Return parity bytes for the given message.
-        msg: highest-degree-first list of ints (0..255).
+        msg: highest-degree-first list of ints (0..255), or bytes/bytearray.
         This uses canonical shortening: it encodes as full-255 and returns parity for that mapping.
         """
         k = len(msg)
         if k + self.nsym > self.n:
             raise ValueError("Message too long for RS(255)")
-        # Left-pad so message sits at right of full 255-length polynomial
-        pad_len = self.n - (k + self.nsym)
-        msg_full = [0] * pad_len + msg
-        # Multiply by x^nsym: append nsym zeros
-        msg_poly = msg_full + [0] * self.nsym
-        gen = self.generator()
-        _, remainder = divmod_poly(msg_poly, gen, self.gf)
-        # normalize remainder length to nsym
-        if len(remainder) < self.nsym:
-            rem = [0] * (self.nsym - len(remainder)) + remainder
-        else:
-            rem = remainder[-self.nsym:]
-        return rem
+        # Left-padding to the full 255-length mapping only adds leading zero
+        # coefficients, which leave the remainder unchanged, so skip it.
+        return rs_remainder(msg, self.generator(), self.gf)
 
-    def encode(self, msg: List[int], shorten: bool = True) -> List[int]:
+    def encode(self, msg: Symbols, shorten: bool = True) -> Symbols:
         """
-        Return systematic codeword (message + parity).
+        Return systematic codeword (message + parity), of the same type as msg.
         If shorten=True (default), returns right-most k+nsym bytes (shortened).
         If shorten=False, returns full 255-length codeword (msg left-padded).
         """
-        if any((not isinstance(x, int)) or x < 0 or x > 255 for x in msg):
+        # bytes-like input is in range by construction
+        if not isinstance(msg, (bytes, bytearray)) and any((not isinstance(x, int)) or x < 0 or x > 255 for x in msg):
             raise ValueError("msg values must be ints in range 0..255")
         k = len(msg)
         if k + self.nsym > self.n:
@@ -64,13 +61,34 @@ class RSCodec:
         # compute parity for canonical full-length mapping
         parity = self.parity_for(msg)
         # build full codeword
-        msg_full = [0] * pad_len + msg
+        msg_full = [0] * pad_len + list(msg)
         cw_full = msg_full + parity
         if shorten:
-            return cw_full[-(k + self.nsym):]
-        return cw_full
+            return type(msg)(cw_full[-(k + self.nsym):])
+        return type(msg)(cw_full)
+
+    def encode_batch(self, msgs: List[Symbols]) -> List[Symbols]:
+        """
+        Return shortened systematic codewords for many messages of equal length k,
+        each of the same type as its message.
+        Length is checked once for the batch and the generator is fetched once;
+        each message is then encoded with rs_remainder.
+        """
+        if not msgs:
+            return []
+        k = len(msgs[0])
+        if k + self.nsym > self.n:
+            raise ValueError("Message too long for RS(255)")
+        for msg in msgs:
+            if len(msg) != k:
+                raise ValueError("encode_batch needs messages of equal length")
+            # bytes-like input is in range by construction
+            if not isinstance(msg, (bytes, bytearray)) and any((not isinstance(x, int)) or x < 0 or x > 255 for x in msg):
+                raise ValueError("msg values must be ints in range 0..255")
+        gen = self.generator()
+        return [type(msg)(list(msg) + rs_remainder(msg, gen, self.gf)) for msg in msgs]
 
 # convenience functional API
-def rs_encode_msg(msg: List[int], nsym: int) -> List[int]:
+def rs_encode_msg(msg: Symbols, nsym: int) -> Symbols:
     codec = RSCodec(nsym)
     return codec.encode(msg)
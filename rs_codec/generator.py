@@ -1,13 +1,22 @@
 # rs_codec/generator.py
 # Build the RS generator polynomial g(x) = (x - alpha^1)(x - alpha^2)...(x - alpha^nsym)
-from typing import List
-from .gf import GF
-from .poly import mul, trim
+from functools import lru_cache
+from typing import List, Tuple
+from .gf import GF, get_gf
 
 def rs_generator_poly(nsym: int, gf: GF) -> List[int]:
-    g = [1]
+    exp, log = gf.exp, gf.log
+    # Built in place in a buffer of the final length nsym + 1 (highest-first).
+    # Multiplying by the monic factor (x - alpha^(i+1)) never introduces a leading
+    # zero, so there is no per-step trim and no intermediate list.
+    g = [1] + [0] * nsym
     for i in range(nsym):
-        # factor corresponds to (x - alpha^(i+1)) ; subtraction == addition in GF(2^m)
-        factor = [1, gf.alpha_pow(i + 1)]
-        g = mul(g, factor, gf)
-    return trim(g)
+        # g occupies g[0..i]; new g[j] = g[j] + alpha^(i+1) * g[j-1], walking down
+        # so g[j-1] is still the old coefficient. subtraction == addition in GF(2^m)
+        for j in range(i + 1, 0, -1):
+            g[j] ^= exp[log[g[j - 1]] + i + 1]
+    return g
+
+@lru_cache(maxsize=64)
+def _cached_gen(nsym: int, prim: int, generator: int) -> Tuple[int, ...]:
+    return tuple(rs_generator_poly(nsym, get_gf(prim, generator)))
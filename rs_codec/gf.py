@@ -1,27 +1,64 @@
 # rs_codec/gf.py
 # GF(2^8) arithmetic (primitive polynomial 0x11d)
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 
 PRIM = 0x11d
 FIELD_SIZE = 256
 GENERATOR = 2
+# x^8+x^4+x^3+x+1, the polynomial hard-wired into GFNI (VGF2P8MULB) and AES.
+# 2 is not primitive for it, so pair it with GFNI_GENERATOR.
+GFNI_PRIM = 0x11b
+GFNI_GENERATOR = 3
+
+def _mul_no_lut(a: int, b: int, prim: int) -> int:
+    """Carry-less a*b reduced modulo prim; only used to build the tables."""
+    r = 0
+    while b:
+        if b & 1:
+            r ^= a
+        b >>= 1
+        a <<= 1
+        if a & 0x100:
+            a ^= prim
+    return r
+
+@lru_cache(maxsize=8)
+def _build_tables(prim: int, generator: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    exp/log tables for the field, built once per (prim, generator) and shared
+    read-only by every GF instance.
+
+    log[0] is a Zech-style sentinel (2n + 1) beyond any sum of two real logs
+    (<= 2n - 2) and exp is zero from there on, so exp[log[a] + log[b]] is the
+    product even when a or b is zero. exp[0..2n] is doubled so log sums need no modulo.
+    """
+    n = FIELD_SIZE - 1
+    log_zero = 2 * n + 1
+    exp = [0] * (2 * log_zero + 1)
+    log = [log_zero] * (n + 1)
+    x = 1
+    for i in range(n):
+        if i and x <= 1:
+            raise ValueError(f"{generator} does not generate GF(2^8) modulo {hex(prim)}")
+        exp[i] = x
+        log[x] = i
+        x = _mul_no_lut(x, generator, prim)
+    for i in range(n, 2 * n + 1):
+        exp[i] = exp[i - n]
+    # tuples rather than bytes/array: indexing them is as fast as a list
+    return tuple(exp), tuple(log)
+
+# the default field's tables are built at import time
+_build_tables(PRIM, GENERATOR)
 
 class GF:
-    def __init__(self, prim: int = PRIM):
+    def __init__(self, prim: int = PRIM, generator: int = GENERATOR):
         self.prim = prim
-        self.n = 255
-        # exp/log tables for fast mul/div
-        self.exp: List[int] = [0] * (2 * self.n + 1)
-        self.log: List[int] = [-1] * (self.n + 1)
-        x = 1
-        for i in range(self.n):
-            self.exp[i] = x
-            self.log[x] = i
-            x <<= 1
-            if x & 0x100:
-                x ^= self.prim
-        for i in range(self.n, 2 * self.n + 1):
-            self.exp[i] = self.exp[i - self.n]
+        self.generator = generator
+        self.n = FIELD_SIZE - 1
+        self.log_zero = 2 * self.n + 1
+        self.exp, self.log = _build_tables(prim, generator)
 
     def add(self, a: int, b: int) -> int:
         return a ^ b
@@ -30,19 +67,33 @@ class GF:
         return a ^ b
 
     def mul(self, a: int, b: int) -> int:
-        if a == 0 or b == 0:
-            return 0
-        return self.exp[(self.log[a] + self.log[b]) % self.n]
+        # branchless: a zero operand lands in the zero tail of exp
+        return self.exp[self.log[a] + self.log[b]]
 
     def div(self, a: int, b: int) -> int:
         assert b != 0
         if a == 0:
             return 0
-        return self.exp[(self.log[a] - self.log[b]) % self.n]
+        # log[a] + n - log[b] lies in [1, 2n - 1], inside the doubled exp table
+        return self.exp[self.log[a] + self.n - self.log[b]]
 
     def inv(self, a: int) -> int:
         assert a != 0
-        return self.exp[(self.n - self.log[a]) % self.n]
+        return self.exp[self.n - self.log[a]]
+
+    def pow(self, a: int, p: int) -> int:
+        if a == 0:
+            return 0
+        return self.exp[(self.log[a] * p) % self.n]
 
     def alpha_pow(self, p: int) -> int:
         return self.exp[p % self.n]
+
+@lru_cache(maxsize=8)
+def _cached_gf(prim: int, generator: int) -> GF:
+    return GF(prim, generator)
+
+def get_gf(prim: int = PRIM, generator: int = GENERATOR) -> GF:
+    """Shared GF instance for (prim, generator); tables are read-only after construction."""
+    # normalize to positional args so get_gf(), get_gf(p) and get_gf(p, g) share one cache entry
+    return _cached_gf(prim, generator)
@@ -21,26 +21,29 @@ def mul(a: List[int], b: List[int], gf: GF) -> List[int]:
     """Polynomial multiplication (highest-first)."""
     if not a or not b:
         return [0]
+    exp, log = gf.exp, gf.log
     res = [0] * (len(a) + len(b) - 1)
+    # Outer sum of logs: a[i] * b[j] == exp[log[a[i]] + log[b[j]]]
+    b_terms = [(j, log[bj]) for j, bj in enumerate(b) if bj != 0]
     for i, ai in enumerate(a):
         if ai == 0:
             continue
-        for j, bj in enumerate(b):
-            if bj == 0:
-                continue
-            res[i + j] = gf.add(res[i + j], gf.mul(ai, bj))
+        la = log[ai]
+        for j, lb in b_terms:
+            res[i + j] ^= exp[la + lb]
     return trim(res)
 
 def divmod_poly(dividend: List[int], divisor: List[int], gf: GF) -> Tuple[List[int], List[int]]:
     """Polynomial long division (both highest-first). Returns (quotient, remainder)."""
-    dividend = trim(dividend[:])
-    divisor = trim(divisor[:])
+    # trim() returns a fresh slice, so no extra copies are needed
+    dividend = trim(dividend)
+    divisor = trim(divisor)
     if len(divisor) == 0 or (len(divisor) == 1 and divisor[0] == 0):
         raise ZeroDivisionError("Division by zero polynomial")
     if len(dividend) < len(divisor):
         return [0], dividend
     quotient = [0] * (len(dividend) - len(divisor) + 1)
-    rem = dividend[:]
+    rem = dividend
     for i in range(len(quotient)):
         coef = rem[i]
         if coef != 0:
@@ -50,3 +53,22 @@ def divmod_poly(dividend: List[int], divisor: List[int], gf: GF) -> Tuple[List[i
                 rem[i + j] = gf.sub(rem[i + j], gf.mul(divisor[j], factor))
     remainder = rem[-(len(divisor) - 1):] if len(divisor) > 1 else [0]
     return trim(quotient), trim(remainder)
+
+def rs_remainder(msg: List[int], gen: List[int], gf: GF) -> List[int]:
+    """
+    Remainder of msg(x) * x^nsym divided by the monic generator gen (both highest-first).
+    Synthetic division: no quotient and no gf.div since gen[0] == 1.
+    Always returns exactly nsym = len(gen) - 1 coefficients.
+    """
+    exp, log = gf.exp, gf.log
+    nsym = len(gen) - 1
+    # logs of the generator tail, computed once per call rather than per step
+    gen_tail = [(j, log[g]) for j, g in enumerate(gen) if j > 0 and g != 0]
+    buf = list(msg) + [0] * nsym
+    for i in range(len(msg)):
+        coef = buf[i]
+        if coef != 0:
+            lc = log[coef]
+            for j, lg in gen_tail:
+                buf[i + j] ^= exp[lc + lg]
+    return buf[len(msg):]
@@ -2,56 +2,16 @@
 # rs_encoder.py
 # Systematic Reed–Solomon encoder (GF(2^8), primitive 0x11d)
 
-from typing import List
+from typing import List, Union
 
-PRIM = 0x11d
-FIELD_SIZE = 256
-GENERATOR = 2
-
-class GF:
-    def __init__(self, prim=PRIM):
-        self.prim = prim
-        self.n = 255
-        self.exp = [0] * (2 * self.n + 1)
-        self.log = [-1] * (self.n + 1)
-        x = 1
-        for i in range(self.n):
-            self.exp[i] = x
-            self.log[x] = i
-            x <<= 1
-            if x & 0x100:
-                x ^= self.prim
-        for i in range(self.n, 2 * self.n + 1):
-            self.exp[i] = self.exp[i - self.n]
-
-    def add(self, a: int, b: int) -> int:
-        return a ^ b
-
-    def sub(self, a: int, b: int) -> int:
-        return a ^ b
-
-    def mul(self, a: int, b: int) -> int:
-        if a == 0 or b == 0:
-            return 0
-        return self.exp[(self.log[a] + self.log[b]) % self.n]
-
-    def div(self, a: int, b: int) -> int:
-        assert b != 0
-        if a == 0:
-            return 0
-        return self.exp[(self.log[a] - self.log[b]) % self.n]
-
-    def inv(self, a: int) -> int:
-        assert a != 0
-        return self.exp[(self.n - self.log[a]) % self.n]
-
-    def pow(self, a: int, p: int) -> int:
-        if a == 0:
-            return 0
-        return self.exp[(self.log[a] * p) % self.n]
-
-    def alpha_pow(self, p: int) -> int:
-        return self.exp[p % self.n]
+# one GF implementation for the whole project; get_gf shares instances per field
+from rs_codec.gf import GF, PRIM, GENERATOR, get_gf
+# g(x) = (x - alpha^1)(x - alpha^2)...(x - alpha^nsym), built in place and memoized per field
+from rs_codec.generator import _cached_gen
+from rs_codec.poly import rs_remainder
+# re-exported: this module used to define these names itself
+from rs_codec.gf import FIELD_SIZE  # noqa: F401
+from rs_codec.generator import rs_generator_poly  # noqa: F401
 
 # polynomial utilities (highest-degree first)
 def poly_trim(p: List[int]) -> List[int]:
@@ -70,10 +30,16 @@ def poly_add(a: List[int], b: List[int], gf: GF) -> List[int]:
 
 def poly_mul(a: List[int], b: List[int], gf: GF) -> List[int]:
     # highest-first
+    # outer sum of logs: a[i]*b[j] == exp[log[a[i]] + log[b[j]]], zero terms skipped
+    exp, log = gf.exp, gf.log
     res = [0]*(len(a)+len(b)-1)
+    b_terms = [(j, log[bj]) for j, bj in enumerate(b) if bj != 0]
     for i, ai in enumerate(a):
-        for j, bj in enumerate(b):
-            res[i+j] = gf.add(res[i+j], gf.mul(ai, bj))
+        if ai == 0:
+            continue
+        la = log[ai]
+        for j, lb in b_terms:
+            res[i+j] ^= exp[la + lb]
     return res
 
 def poly_divmod(dividend: List[int], divisor: List[int], gf: GF):
@@ -97,63 +63,57 @@ def poly_divmod(dividend: List[int], divisor: List[int], gf: GF):
     remainder = rem[-(len(divisor)-1):] if len(divisor) > 1 else [0]
     return poly_trim(quotient), poly_trim(remainder)
 
-def rs_generator_poly(nsym: int, gf: GF) -> List[int]:
-    # g(x) = (x - alpha^1)(x - alpha^2)...(x - alpha^nsym)
-    g = [1]
-    for i in range(nsym):
-        # multiply g by [1, alpha^ (i) ]? careful: we want x - alpha^{i+1}
-        # highest-first representation: [1, -alpha^k] but since in GF subtraction == addition:
-        factor = [1, gf.alpha_pow(i+1)]  # corresponds to x + alpha^{i+1} but sign is XOR (same)
-        g = poly_mul(g, factor, gf)
-    return poly_trim(g)
-
-def rs_encode_msg(msg: List[int], nsym: int, prim: int = PRIM, verbose: bool = False) -> List[int]:
+def rs_encode_msg(msg: Union[List[int], bytes, bytearray], nsym: int, prim: int = PRIM, verbose: bool = False,
+                  generator: int = GENERATOR) -> Union[List[int], bytes, bytearray]:
     """
     Systematic RS encoder: returns message + parity (each symbol 0..255).
-    msg: list of ints length k
+    msg: list of ints length k, or bytes/bytearray; the codeword has the same type
     nsym: number of parity symbols
     verbose: if True, print internal steps for debugging/learning
+    prim/generator: field polynomial and primitive element (e.g. GFNI_PRIM, GFNI_GENERATOR)
     """
-    gf = GF(prim)
+    gf = get_gf(prim, generator)
     if len(msg) + nsym > 255:
         raise ValueError("Message too long for RS(255,k)")
 
     # 1) Build generator polynomial
-    gen = rs_generator_poly(nsym, gf)  # highest-first
+    gen = list(_cached_gen(nsym, gf.prim, gf.generator))  # highest-first
     if verbose:
         print("=== ENCODER STEP: Generator polynomial (highest-first coeffs) ===")
         print(gen)
 
     # 2) Form message polynomial shifted by x^nsym (append nsym zeros)
-    msg_poly = msg[:] + [0] * nsym  # highest-first representation
+    msg_poly = list(msg) + [0] * nsym  # highest-first representation
     if verbose:
         print("=== ENCODER STEP: Message polynomial shifted by x^nsym ===")
         print("msg_poly (highest-first):", msg_poly)
 
     # 3) Polynomial division: (msg(x) * x^nsym) // g(x)
-    quotient, remainder = poly_divmod(msg_poly, gen, gf)
     if verbose:
+        # long division, so the quotient can be shown too
+        quotient, remainder = poly_divmod(msg_poly, gen, gf)
         print("=== ENCODER STEP: Polynomial division result ===")
         print("quotient (highest-first):", quotient)
         print("remainder (highest-first):", remainder)
-
-    # 4) Normalize remainder length to nsym
-    if len(remainder) < nsym:
-        rem = [0] * (nsym - len(remainder)) + remainder
-    else:
-        rem = remainder[-nsym:]
-    if verbose:
+        # 4) Normalize remainder length to nsym
+        if len(remainder) < nsym:
+            rem = [0] * (nsym - len(remainder)) + remainder
+        else:
+            rem = remainder[-nsym:]
         print("=== ENCODER STEP: Parity (padded to nsym) ===")
         print("parity bytes (highest-first):", rem)
+    else:
+        # gen is monic: synthetic division yields exactly nsym parity symbols
+        rem = rs_remainder(msg, gen, gf)
 
     # 5) Build systematic codeword: message + parity
-    codeword = msg + rem
+    codeword = list(msg) + rem
     if verbose:
         print("=== ENCODER STEP: Final codeword (systematic) ===")
         print("codeword:", codeword)
 
     # ensure byte values are 0..255
-    return [x & 0xFF for x in codeword]
+    return type(msg)([x & 0xFF for x in codeword])
 
 if __name__ == "__main__":
     msg = [32,91,11,120,209]
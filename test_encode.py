@@ -1,4 +1,6 @@
 from rs_codec.encoder import RSCodec, rs_encode_msg
+from rs_codec.gf import GFNI_PRIM, GFNI_GENERATOR
+from rs_bm_forney import rs_bm_forney_decode
 
 def main():
     # Example message
@@ -14,5 +16,35 @@ def main():
     cw = codec.encode(message)
     print("Encoded codeword (from RSCodec):", cw)
 
+    # Batch encoding matches one-at-a-time encoding
+    msgs = [[(i * 31 + j * 7) % 256 for j in range(20)] for i in range(10)]
+    assert codec.encode_batch(msgs) == [codec.encode(m) for m in msgs]
+    byte_msgs = [bytes(m) for m in msgs]
+    assert codec.encode_batch(byte_msgs) == [codec.encode(m) for m in byte_msgs]
+    print("encode_batch matches encode for", len(msgs), "messages")
+
+    # GFNI-compatible field (0x11b, alpha = 3): encode -> corrupt -> decode
+    gfni = RSCodec(nsym, prim=GFNI_PRIM, generator=GFNI_GENERATOR)
+    cw_gfni = gfni.encode(message)
+    rx = cw_gfni[:]
+    rx[1] ^= 7
+    rx[6] ^= 200
+    corrected, info = rs_bm_forney_decode(rx, nsym, prim=GFNI_PRIM, generator=GFNI_GENERATOR)
+    print("Encoded codeword (GFNI field):", cw_gfni)
+    print("Decoded codeword (GFNI field):", corrected)
+    assert info['corrected'] and corrected == cw_gfni
+
+    # Syndromes take the packed path only for short codewords (n <= 64, nsym <= 8);
+    # round-trip one codeword past each limit to cover the log-table path too
+    for k, t_nsym in ((80, 4), (20, 10)):
+        long_codec = RSCodec(t_nsym)
+        cw_long = long_codec.encode(bytes((i * 13 + 5) % 256 for i in range(k)))
+        rx = bytearray(cw_long)
+        for pos in range(0, len(rx), len(rx) // (t_nsym // 2))[:t_nsym // 2]:
+            rx[pos] ^= 0x5A
+        corrected, info = rs_bm_forney_decode(rx, t_nsym)
+        assert info['corrected'] and corrected == bytearray(cw_long)
+        print("Decoded n =", len(cw_long), "nsym =", t_nsym, "with", t_nsym // 2, "errors")
+
 if __name__ == "__main__":
     main()
@@ -36,16 +36,17 @@ print("Recovered string:", recovered_string)
 # 3) Full sweep: test 100 trials per error count
 trials = 100
 results = {}
+message_bytes = bytes(message)
 for ecount in range(0, nsym+2):  # 0..nsym+1
     succ = 0
     for _ in range(trials):
-        rx = codeword[:]
+        rx = bytearray(codeword)
         if ecount > 0:
             pos = random.sample(range(n), ecount)
             for p in pos:
                 rx[p] ^= random.randint(1,255)
         corr, inf = rs_bm_forney_decode(rx, nsym)
-        if inf.get('corrected') and corr[:k] == message:
+        if inf.get('corrected') and corr[:k] == message_bytes:
             succ += 1
     results[ecount] = {'successes': succ, 'trials': trials, 'rate': succ / trials}
 print("\nResults (formatted):")